@@ -3,24 +3,32 @@ import os
 import time
 from dotenv import load_dotenv
 
+# Set page config (must stay the first Streamlit command)
+st.set_page_config(
+    page_title="NFL Play Call - Super Bowl LX",
+    layout="wide",
+    initial_sidebar_state="collapsed"
+)
+
 # Clear Streamlit cache on startup
 if "initialized" not in st.session_state:
     st.cache_data.clear()
     st.session_state.initialized = True
 
-# Load environment variables
-load_dotenv()
+# Load environment variables and API key once per process
+@st.cache_resource
+def _api_key():
+    load_dotenv()
+    return os.getenv("ANTHROPIC_API_KEY") or st.secrets.get("ANTHROPIC_API_KEY")
 
-# Get API key
-api_key = os.getenv("ANTHROPIC_API_KEY") or st.secrets.get("ANTHROPIC_API_KEY")
+api_key = _api_key()
 
 if not api_key:
     st.error("❌ ANTHROPIC_API_KEY not found! Add it to .env or Streamlit Secrets.")
     st.stop()
 
 # Import SuperBowlAgent and game_state
-from superbowlagent import SuperBowlAgent, game_state
-import random
+from superbowlagent import NFL_LESSON_TOPICS, SuperBowlAgent, game_state
 
 # Initialize agent
 if "agent" not in st.session_state:
@@ -28,19 +36,16 @@ if "agent" not in st.session_state:
 
 agent = st.session_state.agent
 
+@st.cache_resource
+def _feed_agent():
+    """One agent per process owns the ESPN poller, so every session shares one feed"""
+    return SuperBowlAgent()
+
 # Get user timezone
 user_timezone = st.session_state.get("timezone", "America/New_York")
 
-# Set page config
-st.set_page_config(
-    page_title="NFL Play Call - Super Bowl LX",
-    layout="wide",
-    initial_sidebar_state="collapsed"
-)
-
 # Custom CSS
-st.markdown("""
-    <style>
+CSS = """
         * {
             margin: 0;
             padding: 0;
@@ -102,6 +107,30 @@ st.markdown("""
             text-shadow: 0 0 10px #0C2C56;
         }
 
+        .status-row {
+            display: flex;
+            justify-content: space-around;
+        }
+
+        .status-label {
+            font-size: 0.9em;
+            opacity: 0.8;
+        }
+
+        .status-value {
+            font-size: 2em;
+            font-weight: 600;
+        }
+
+        .score-row {
+            display: flex;
+            gap: 20px;
+        }
+
+        .score-row > div {
+            flex: 1;
+        }
+
         .feature-card {
             background: rgba(0, 51, 102, 0.9);
             border-radius: 15px;
@@ -117,89 +146,177 @@ st.markdown("""
             padding: 20px;
             margin-bottom: 20px;
         }
-    </style>
-""", unsafe_allow_html=True)
+"""
 
-# Header
-st.markdown("""
+# Static page fragments (plain HTML, no markdown parsing needed)
+HEADER_HTML = """
 <div style="text-align: center; margin-bottom: 40px;">
     <h1>🏈 NFL Play Call</h1>
     <p style="font-size: 1.2em; color: #00ff88;">Super Bowl LX Live Experience</p>
 </div>
-""", unsafe_allow_html=True)
+"""
 
-# Get current game time
-game_time, quarter = agent.get_game_time(user_timezone)
-local_time = agent.get_user_local_time(user_timezone)
-
-# Status Bar
-col1, col2, col3, col4 = st.columns(4)
+COMMENTARY_CARD_HTML = """
+<div class="feature-card">
+    <h3 style="color: #00ff88; margin-bottom: 12px;">🎙️ Play Commentary</h3>
+    <p style="color: #ccc; line-height: 1.6;">Get exciting live commentary from our AI broadcaster!</p>
+</div>
+"""
 
-with col1:
-    status = "LIVE" if game_state["game_started"] else "PENDING"
-    st.metric("🔴 Status", status)
+NFL_BASICS_CARD_HTML = """
+<div class="feature-card">
+    <h3 style="color: #00ff88; margin-bottom: 12px;">🏈 NFL Basics</h3>
+    <p style="color: #ccc; line-height: 1.6;">Learn about football concepts!</p>
+</div>
+"""
 
-with col2:
-    st.metric("⏱️ Game Time", f"Q{quarter} • {game_time}")
+SENTIMENT_CARD_HTML = """
+<div class="feature-card">
+    <h3 style="color: #00ff88; margin-bottom: 12px;">😍 Fan Sentiment</h3>
+    <p style="color: #ccc; line-height: 1.6;">See what fans are saying on social media!</p>
+</div>
+"""
 
-with col3:
-    possession = "🅿️ Patriots" if game_state['possession'] == "NE" else "🦅 Seahawks"
-    st.metric("📍 Possession", possession)
+FUN_FACT_HTML = """
+<div class="fun-fact">
+    <strong>📚 Super Bowl Facts</strong>
+</div>
+"""
 
-with col4:
-    st.metric("🕐 Local Time", local_time)
+FOOTER_HTML = """
+<div style="text-align: center; padding-top: 30px; border-top: 1px solid #00ff88; color: #00ccff; opacity: 0.7;">
+    <p>🏆 NFL Play Call - Your AI-Powered Super Bowl Companion 🏆</p>
+    <p style="font-size: 0.9em; margin-top: 10px;">Real-time updates • Beginner-friendly insights • Live sentiment analysis</p>
+</div>
+"""
 
-st.divider()
+@st.cache_resource
+def _inject_css():
+    """Emit the page stylesheet once; later reruns replay the cached element"""
+    st.markdown(f"<style>{CSS}</style>", unsafe_allow_html=True)
+    return True
 
-# Scoreboard
-col1, col2 = st.columns(2)
+_inject_css()
 
-with col1:
-    st.markdown(f"""
-    <div class="patriots-card">
-        <div style="font-size: 3em; margin-bottom: 15px;">🅿️</div>
-        <div style="font-size: 1.5em; margin-bottom: 10px; text-transform: uppercase; letter-spacing: 1px;">New England Patriots</div>
-        <div class="team-score patriots-score">{game_state['current_score']['NE']}</div>
-        <div style="margin-top: 15px; color: #b0b7bc;">↑ Momentum</div>
-    </div>
-    """, unsafe_allow_html=True)
+# Header
+st.html(HEADER_HTML)
 
-with col2:
-    st.markdown(f"""
-    <div class="seahawks-card">
-        <div style="font-size: 3em; margin-bottom: 15px;">🦅</div>
-        <div style="font-size: 1.5em; margin-bottom: 10px; text-transform: uppercase; letter-spacing: 1px;">Seattle Seahawks</div>
-        <div class="team-score seahawks-score">{game_state['current_score']['SEA']}</div>
-        <div style="margin-top: 15px; color: #69be28;">Regrouping</div>
-    </div>
-    """, unsafe_allow_html=True)
+# Status bar template
+POSSESSION_MAP = {"NE": "🅿️ Patriots", "SEA": "🦅 Seahawks"}
 
-st.divider()
+STATUS_BAR = """
+<div class="status-row">
+    <div><div class="status-label">🔴 Status</div><div class="status-value">{status}</div></div>
+    <div><div class="status-label">⏱️ Game Time</div><div class="status-value">Q{quarter} • {game_time}</div></div>
+    <div><div class="status-label">📍 Possession</div><div class="status-value">{possession}</div></div>
+    <div><div class="status-label">🕐 Local Time</div><div class="status-value">{local_time}</div></div>
+</div>
+"""
+
+def status_bar_html(status, quarter, game_time, possession, local_time):
+    """Status bar row; not cached, since the game clock and local time change it every tick"""
+    return STATUS_BAR.format(
+        status=status,
+        quarter=quarter,
+        game_time=game_time,
+        possession=possession,
+        local_time=local_time
+    )
 
-# Win Probability
-col1, col2 = st.columns(2)
+# Scoreboard and win-probability templates
+PATRIOTS_CARD = """
+<div class="patriots-card">
+    <div style="font-size: 3em; margin-bottom: 15px;">🅿️</div>
+    <div style="font-size: 1.5em; margin-bottom: 10px; text-transform: uppercase; letter-spacing: 1px;">New England Patriots</div>
+    <div class="team-score patriots-score">{score}</div>
+    <div style="margin-top: 15px; color: #b0b7bc;">↑ Momentum</div>
+</div>
+"""
+
+SEAHAWKS_CARD = """
+<div class="seahawks-card">
+    <div style="font-size: 3em; margin-bottom: 15px;">🦅</div>
+    <div style="font-size: 1.5em; margin-bottom: 10px; text-transform: uppercase; letter-spacing: 1px;">Seattle Seahawks</div>
+    <div class="team-score seahawks-score">{score}</div>
+    <div style="margin-top: 15px; color: #69be28;">Regrouping</div>
+</div>
+"""
 
-with col1:
-    ne_prob = game_state['win_probability']['NE']
-    st.markdown(f"""
-    <div style="background: rgba(0, 51, 102, 0.9); border-radius: 15px; padding: 20px;">
-        <div style="color: #00ccff; margin-bottom: 10px;">Patriots Win Probability</div>
-        <div style="width: 100%; background: rgba(255, 255, 255, 0.1); border-radius: 10px; overflow: hidden; height: 30px;">
-            <div style="width: {ne_prob}%; background: linear-gradient(90deg, #002B5C, #b0b7bc); height: 100%; display: flex; align-items: center; justify-content: center; color: white; font-weight: bold;">{ne_prob}%</div>
-        </div>
+WIN_PROB_BAR = """
+<div style="background: rgba(0, 51, 102, 0.9); border-radius: 15px; padding: 20px;">
+    <div style="color: #00ccff; margin-bottom: 10px;">{team} Win Probability</div>
+    <div style="width: 100%; background: rgba(255, 255, 255, 0.1); border-radius: 10px; overflow: hidden; height: 30px;">
+        <div style="width: {prob}%; background: linear-gradient(90deg, {gradient}); height: 100%; display: flex; align-items: center; justify-content: center; color: white; font-weight: bold;">{prob}%</div>
     </div>
-    """, unsafe_allow_html=True)
+</div>
+"""
+
+@st.cache_data
+def patriots_html(ne):
+    """Patriots scoreboard card, rebuilt only when their score changes"""
+    return PATRIOTS_CARD.format(score=ne)
+
+@st.cache_data
+def seahawks_html(sea):
+    """Seahawks scoreboard card, rebuilt only when their score changes"""
+    return SEAHAWKS_CARD.format(score=sea)
+
+@st.cache_data(ttl=1)
+def _game_time(tz):
+    """Game clock for this tick, shared by repeat calls within the same second"""
+    return st.session_state.agent.get_game_time(tz)
+
+@st.cache_data(ttl=1)
+def _local_time(tz):
+    """Viewer's local clock string, shared by repeat calls within the same second"""
+    return st.session_state.agent.get_user_local_time(tz)
+
+def _pull_update():
+    """Pull a game update unless one already landed in the last two seconds"""
+    now = time.monotonic()
+    if now - st.session_state.get("last_update", 0) >= 2:
+        _feed_agent().simulate_game_update()
+        st.session_state.last_update = now
+
+# Live panel: status bar, scoreboard and win probability refresh on their own
+@st.fragment(run_every=2)
+def live_panel():
+    """Re-run only the live scoreboard region every two seconds"""
+    # Get current game time
+    game_time, quarter = _game_time(user_timezone)
+    local_time = _local_time(user_timezone)
+
+    # Status Bar
+    status = "LIVE" if game_state.game_started else "PENDING"
+    possession = POSSESSION_MAP.get(game_state.possession, POSSESSION_MAP["SEA"])
+    st.html(status_bar_html(status, quarter, game_time, possession, local_time))
+
+    st.divider()
+
+    # Scoreboard
+    ne_score, sea_score = game_state.scores()
+    st.markdown(
+        '<div class="score-row">'
+        + patriots_html(ne_score)
+        + seahawks_html(sea_score)
+        + '</div>',
+        unsafe_allow_html=True
+    )
 
-with col2:
-    sea_prob = game_state['win_probability']['SEA']
-    st.markdown(f"""
-    <div style="background: rgba(0, 51, 102, 0.9); border-radius: 15px; padding: 20px;">
-        <div style="color: #00ccff; margin-bottom: 10px;">Seahawks Win Probability</div>
-        <div style="width: 100%; background: rgba(255, 255, 255, 0.1); border-radius: 10px; overflow: hidden; height: 30px;">
-            <div style="width: {sea_prob}%; background: linear-gradient(90deg, #0C2C56, #69be28); height: 100%; display: flex; align-items: center; justify-content: center; color: white; font-weight: bold;">{sea_prob}%</div>
-        </div>
-    </div>
-    """, unsafe_allow_html=True)
+    st.divider()
+
+    # Win Probability
+    ne_prob = game_state.ne_win_prob
+    sea_prob = game_state.sea_win_prob
+    st.markdown(
+        '<div class="score-row">'
+        + WIN_PROB_BAR.format(team="Patriots", prob=ne_prob, gradient="#002B5C, #b0b7bc")
+        + WIN_PROB_BAR.format(team="Seahawks", prob=sea_prob, gradient="#0C2C56, #69be28")
+        + '</div>',
+        unsafe_allow_html=True
+    )
+
+live_panel()
 
 st.divider()
 
@@ -208,34 +325,26 @@ col1, col2, col3 = st.columns(3)
 
 with col1:
     if st.button("▶️ Start Game", use_container_width=True):
-        st.session_state.game_running = True
-        game_state["game_started"] = True
+        game_state.game_started = True
+        _feed_agent().start_poller()
         st.rerun()
 
 with col2:
     if st.button("🔄 Update", use_container_width=True):
-        agent.simulate_game_update()
+        _pull_update()
         st.rerun()
 
 with col3:
     if st.button("⏹️ Stop", use_container_width=True):
-        st.session_state.game_running = False
-        st.rerun()
+        _feed_agent().stop_poller()
 
 st.divider()
 
-# Live Features
-st.subheader("🎙️ Live Features")
-
-tab1, tab2, tab3, tab4 = st.tabs(["Commentary", "NFL Basics", "Sentiment", "Fun Facts"])
-
-with tab1:
-    st.markdown("""
-    <div class="feature-card">
-        <h3 style="color: #00ff88; margin-bottom: 12px;">🎙️ Play Commentary</h3>
-        <p style="color: #ccc; line-height: 1.6;">Get exciting live commentary from our AI broadcaster!</p>
-    </div>
-    """, unsafe_allow_html=True)
+# Live Features tab bodies
+@st.fragment
+def commentary_tab():
+    """Commentary tab body; button clicks re-run only this fragment"""
+    st.html(COMMENTARY_CARD_HTML)
     
     if st.button("Generate Commentary", key="commentary"):
         with st.spinner("Generating commentary..."):
@@ -246,19 +355,15 @@ with tab1:
             except Exception as e:
                 st.error(f"❌ Error: {str(e)}")
 
-with tab2:
-    st.markdown("""
-    <div class="feature-card">
-        <h3 style="color: #00ff88; margin-bottom: 12px;">🏈 NFL Basics</h3>
-        <p style="color: #ccc; line-height: 1.6;">Learn about football concepts!</p>
-    </div>
-    """, unsafe_allow_html=True)
+@st.fragment
+def nfl_basics_tab():
+    """NFL Basics tab body; button clicks re-run only this fragment"""
+    st.html(NFL_BASICS_CARD_HTML)
     
     # Create selectbox
-    lesson_options = ["touchdown", "down", "penalty", "turnover", "sack", "field goal"]
     lesson_topic = st.selectbox(
         "Choose a topic to learn:",
-        lesson_options,
+        NFL_LESSON_TOPICS,
         key="nfl_lesson"
     )
     
@@ -285,13 +390,10 @@ with tab2:
                 st.error(f"❌ Error: {str(e)}")
                 print(f"Debug error: {e}")  # Print to console for debugging
 
-with tab3:
-    st.markdown("""
-    <div class="feature-card">
-        <h3 style="color: #00ff88; margin-bottom: 12px;">😍 Fan Sentiment</h3>
-        <p style="color: #ccc; line-height: 1.6;">See what fans are saying on social media!</p>
-    </div>
-    """, unsafe_allow_html=True)
+@st.fragment
+def sentiment_tab():
+    """Fan Sentiment tab body; button clicks re-run only this fragment"""
+    st.html(SENTIMENT_CARD_HTML)
     
     if st.button("Analyze Sentiment", key="sentiment"):
         with st.spinner("Analyzing sentiment..."):
@@ -330,12 +432,10 @@ with tab3:
                 st.error(f"❌ Error: {str(e)}")
                 st.write("Debug info:", type(sentiment) if 'sentiment' in locals() else "sentiment not defined")
 
-with tab4:
-    st.markdown("""
-    <div class="fun-fact">
-        <strong>📚 Super Bowl Facts</strong>
-    </div>
-    """, unsafe_allow_html=True)
+@st.fragment
+def fun_facts_tab():
+    """Fun Facts tab body; button clicks re-run only this fragment"""
+    st.html(FUN_FACT_HTML)
     
     if st.button("Show Fun Fact", key="fun_fact"):
         with st.spinner("Loading fun fact..."):
@@ -356,19 +456,29 @@ with tab4:
             except Exception as e:
                 st.error(f"❌ Error: {str(e)}")
 
+# Live Features
+st.subheader("🎙️ Live Features")
+
+FEATURE_TABS = {
+    "Commentary": commentary_tab,
+    "NFL Basics": nfl_basics_tab,
+    "Sentiment": sentiment_tab,
+    "Fun Facts": fun_facts_tab,
+}
+
+# Only the selected feature panel is built and sent to the browser
+feature = st.segmented_control(
+    "Feature",
+    list(FEATURE_TABS),
+    default="Commentary",
+    key="feature",
+    label_visibility="collapsed"
+)
+
+if feature:
+    FEATURE_TABS[feature]()
+
 st.divider()
 
 # Footer
-st.markdown("""
-<div style="text-align: center; padding-top: 30px; border-top: 1px solid #00ff88; color: #00ccff; opacity: 0.7;">
-    <p>🏆 NFL Play Call - Your AI-Powered Super Bowl Companion 🏆</p>
-    <p style="font-size: 0.9em; margin-top: 10px;">Real-time updates • Beginner-friendly insights • Live sentiment analysis</p>
-</div>
-""", unsafe_allow_html=True)
-
-# Auto-update
-if st.session_state.get("game_running", False):
-    if not game_state["game_ended"]:
-        agent.simulate_game_update()
-        time.sleep(2)
-        st.rerun()
\ No newline at end of file
+st.html(FOOTER_HTML)